@@ -20,13 +20,25 @@ from .signal import (
     BlockDone,
 )
 
-from .providers import (
-    ClaudeAdapter,
-    GeminiAdapter,
-    OpenAIAdapter,
-    DeepSeekAdapter,
-    VertexAdapter,
-    TogetherAdapter,
-    UniversalLLMAdapter,
-    XAIAdapter,
-)
+# Adapters are re-exported lazily (PEP 562) so `import synaptic` doesn't pull
+# in every provider SDK; each one loads on first attribute access.
+_LAZY_ADAPTERS = frozenset((
+    "ClaudeAdapter",
+    "GeminiAdapter",
+    "OpenAIAdapter",
+    "DeepSeekAdapter",
+    "VertexAdapter",
+    "TogetherAdapter",
+    "UniversalLLMAdapter",
+    "XAIAdapter",
+))
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ADAPTERS:
+        from . import providers
+
+        value = getattr(providers, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
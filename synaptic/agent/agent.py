@@ -66,7 +66,7 @@ class Agent:
 
     def _add_user(self, prompt: Optional[str], role: str) -> None:
         if prompt is not None:
-            created = datetime.now().astimezone(timezone.utc)
+            created = datetime.now(timezone.utc)
             self.session.history.add(UserMem(message=prompt, role=role, created=created))
 
     def _allow(self, call: ToolCall) -> bool:
@@ -92,7 +92,7 @@ class Agent:
             if not self._allow(call):
                 result = {"name": call.name, "error": "Permission denied"}
             else:
-                result = run_tools_sync(list(self._registry.all().values()), self.model.blacklist, [call])[0]
+                result = run_tools_sync(self._registry.all(), self.model.blacklist, [call])[0]
             self.events.emit("tool_end", call, result)
             results.append(result)
         return results
@@ -104,7 +104,7 @@ class Agent:
             if not await self._aallow(call):
                 result = {"name": call.name, "error": "Permission denied"}
             else:
-                result = (await run_tools_async(list(self._registry.all().values()), self.model.blacklist, [call]))[0]
+                result = (await run_tools_async(self._registry.all(), self.model.blacklist, [call]))[0]
             await self.events.aemit("tool_end", call, result)
             if self.signals:
                 await self.signals.aemit("ToolCallResult", _SignalTCR(call=call, result=result))
@@ -166,7 +166,7 @@ class Agent:
             for _ in range(self.max_turns):
                 accumulated = ""
                 tool_calls: List[ToolCall] = []
-                created = datetime.now().astimezone(timezone.utc)
+                created = datetime.now(timezone.utc)
 
                 if self._text_mode:
                     self.model.instructions = self._base_instructions + build_dsl_instructions(self._registry.all().values())
@@ -1,19 +1,30 @@
+from functools import lru_cache
 from typing import Any, List, Optional
 
-from ..providers import (
-    ClaudeAdapter,
-    DeepSeekAdapter,
-    GeminiAdapter,
-    OpenAIAdapter,
-    TogetherAdapter,
-    UniversalLLMAdapter,
-    VertexAdapter,
-    XAIAdapter,
-)
 from .base import History, ResponseFormat
 from .provider import Provider
 from .tool import Tool, ToolRegistry
 
+# Adapter class names, resolved lazily so building a Model for one provider
+# never imports the other providers' SDKs.
+_PROVIDER_ADAPTERS = {
+    Provider.CLAUDE: "ClaudeAdapter",
+    Provider.OPENAI: "OpenAIAdapter",
+    Provider.GEMINI: "GeminiAdapter",
+    Provider.VERTEX: "VertexAdapter",
+    Provider.DEEPSEEK: "DeepSeekAdapter",
+    Provider.TOGETHER: "TogetherAdapter",
+    Provider.XAI: "XAIAdapter",
+    Provider.UNIVERSAL_OPENAI: "UniversalLLMAdapter",
+}
+
+
+@lru_cache(maxsize=None)
+def _adapter_class(name: str) -> Any:
+    from .. import providers
+
+    return getattr(providers, name)
+
 
 def build_adapter(
     provider: Provider,
@@ -43,25 +54,11 @@ def build_adapter(
         tool_registry=tool_registry,
     )
 
-    if provider == Provider.CLAUDE:
-        return ClaudeAdapter(**kwargs, max_tokens=max_tokens)
-    elif provider == Provider.OPENAI:
-        return OpenAIAdapter(**kwargs)
-    elif provider == Provider.GEMINI:
-        return GeminiAdapter(**kwargs)
-    elif provider == Provider.VERTEX:
-        return VertexAdapter(
-            **{**kwargs, "api_key": None},
-            location=location,
-            project=project,
-        )
-    elif provider == Provider.DEEPSEEK:
-        return DeepSeekAdapter(**kwargs)
-    elif provider == Provider.TOGETHER:
-        return TogetherAdapter(**kwargs)
-    elif provider == Provider.XAI:
-        return XAIAdapter(**kwargs)
-    elif provider == Provider.UNIVERSAL_OPENAI:
-        return UniversalLLMAdapter(**kwargs, base_url=base_url or "")
-    else:
-        return GeminiAdapter(**kwargs)
+    name = _PROVIDER_ADAPTERS.get(provider, "GeminiAdapter")
+    if name == "ClaudeAdapter":
+        kwargs["max_tokens"] = max_tokens
+    elif name == "VertexAdapter":
+        kwargs.update(api_key=None, location=location, project=project)
+    elif name == "UniversalLLMAdapter":
+        kwargs["base_url"] = base_url or ""
+    return _adapter_class(name)(**kwargs)
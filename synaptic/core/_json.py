@@ -0,0 +1,28 @@
+"""Shared JSON helpers with an optional `orjson` fast path.
+
+`orjson` serializes in native code and returns bytes directly, which is
+markedly faster than the stdlib tree walk on large tool declarations and
+history payloads. When it is not installed (install the `perf` extra),
+these helpers fall back to the stdlib with identical signatures.
+"""
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+
+    def dumps(obj: Any, *, sort_keys: bool = False,
+              default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return orjson.dumps(obj, default=default,
+                            option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+
+    def loads(data) -> Any:
+        return orjson.loads(data)
+
+except ImportError:
+    def dumps(obj: Any, *, sort_keys: bool = False,
+              default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return json.dumps(obj, sort_keys=sort_keys, default=default).encode()
+
+    def loads(data) -> Any:
+        return json.loads(data)
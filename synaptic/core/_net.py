@@ -0,0 +1,48 @@
+"""Shared HTTP connection pools for provider SDK clients.
+
+Every adapter construction used to get its own SDK-managed transport, so
+fan-out workloads (ainvoke_many, one Model per request) paid a fresh
+TCP/TLS handshake per client. The OpenAI and Anthropic SDKs both run on
+httpx and accept an external client, so adapters route through these
+process-wide pools instead. Clients are created lazily and reused.
+"""
+from typing import Optional
+
+import httpx
+
+# HTTP/2 multiplexes concurrent requests over one TLS session, cutting
+# handshake count and ephemeral-port use under ainvoke_many bursts. httpx
+# needs the optional h2 package for it (install the `perf` extra); without
+# it we stay on HTTP/1.1 rather than failing client construction.
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_LIMITS = httpx.Limits(
+    max_connections=100,
+    # Keep enough warm connections for a full max_connections burst to
+    # drain without re-handshaking the tail.
+    max_keepalive_connections=64,
+    keepalive_expiry=60,
+)
+
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.Client:
+    """Return the shared sync httpx client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(limits=_LIMITS, http2=_HTTP2)
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared async httpx client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(limits=_LIMITS, http2=_HTTP2)
+    return _async_client
@@ -1,74 +1,164 @@
-import inspect
+import asyncio
+import copy
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Collection, Dict, List, Optional
 
+from . import _json
 from .base import ResponseMem, UserMem
 from .tool import Tool, ToolCall
 
+_VALID_ROLES = frozenset({"user", "assistant", "system"})
+
+
+def _cache_key(model, prompt, role, kwargs, images=None, audio=None) -> Optional[str]:
+    """Cache key for a deterministic call, or None if the call is uncacheable.
+
+    Only text-only temperature-0 calls without extra provider kwargs qualify;
+    anything else — including image/audio attachments, which the key doesn't
+    capture — can legitimately produce different output for the same inputs.
+    """
+    if (model.cache is None or model.temperature != 0 or kwargs or prompt is None
+            or images or audio):
+        return None
+    payload = {
+        "model": model.model,
+        "prompt": prompt,
+        "role": role,
+        "temperature": model.temperature,
+        # Hash the declarations, not just names, so editing a tool's schema
+        # invalidates cached responses. Read the adapter's live toolset:
+        # model.tools is only synced at adapter materialization and goes
+        # stale after registry changes.
+        "tools": sorted(f"{t.name}:{t.declaration_hash.hex()}"
+                        for t in model.llm.synaptic_tools or ()),
+        "schema": str(model.response_schema),
+        "format": model.response_format.value,
+        "instructions": model.instructions,
+    }
+    return hashlib.sha256(_json.dumps(payload, sort_keys=True, default=str)).hexdigest()
+
+
+def _clone_mem(memory: ResponseMem) -> ResponseMem:
+    """Copy a memory for cache storage or serving.
+
+    copy.copy alone would leave the clone sharing the original's
+    tool_calls/tool_results list objects, letting a caller's append bleed
+    into the cache; re-seat both so no list state is shared.
+    """
+    clone = copy.copy(memory)
+    clone.tool_calls = list(memory.tool_calls)
+    clone.tool_results = list(memory.tool_results)
+    return clone
+
+
+def _resolve_flags(model, autorun, automem):
+    """Resolve per-call autorun/automem overrides against model defaults."""
+    return (model.autorun if autorun is None else autorun,
+            model.automem if automem is None else automem)
+
+
+def _run_one_sync(tool_map: Dict[str, Tool], blacklist: Collection[str], call) -> Any:
+    if not isinstance(call, ToolCall):
+        return {"error": "Invalid tool call format"}
+    name, args = call.name, call.args
+    tool = tool_map.get(name)
+    if not tool or name in blacklist:
+        return {"name": name, "error": "Tool not registered or blacklisted"}
+    if tool.is_async:
+        raise RuntimeError(f"Tool '{name}' is async, cannot run in sync invoke()")
+    try:
+        return {"name": name, "result": tool.run(**args)}
+    except Exception as e:
+        return {"name": name, "error": str(e)}
 
-def run_tools_sync(tools: List[Tool], blacklist: List[str], tool_calls: List[ToolCall]) -> List[Any]:
-    results = []
-    tool_map = {t.name: t for t in tools}
-    for call in tool_calls:
-        if not isinstance(call, ToolCall):
-            results.append({"error": "Invalid tool call format"})
-            continue
-        name, args = call.name, call.args
-        tool = tool_map.get(name)
-        if tool and name not in blacklist:
-            if tool.is_async:
-                raise RuntimeError(f"Tool '{name}' is async, cannot run in sync invoke()")
-            try:
-                results.append({"name": name, "result": tool.run(**args)})
-            except Exception as e:
-                results.append({"name": name, "error": str(e)})
-        else:
-            results.append({"name": name, "error": "Tool not registered or blacklisted"})
-    return results
 
+def run_tools_sync(tool_map: Dict[str, Tool], blacklist: Collection[str], tool_calls: List[ToolCall],
+                   parallel: bool = False) -> List[Any]:
+    """Run tool calls from sync code, preserving call order in the results.
 
-async def run_tools_async(tools: List[Tool], blacklist: List[str], tool_calls: List[ToolCall]) -> List[Any]:
-    results = []
-    tool_map = {t.name: t for t in tools}
-    for call in tool_calls:
+    With `parallel=True`, IO-bound tools run on a thread pool so wall-clock
+    latency approaches the slowest call instead of the sum. Leave it off when
+    tools share mutable state.
+    """
+    if parallel and len(tool_calls) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(tool_calls), 8)) as ex:
+            return list(ex.map(lambda call: _run_one_sync(tool_map, blacklist, call), tool_calls))
+    return [_run_one_sync(tool_map, blacklist, call) for call in tool_calls]
+
+
+async def run_tools_async(
+    tool_map: Dict[str, Tool], blacklist: Collection[str], tool_calls: List[ToolCall],
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """Run tool calls concurrently, returning results in call order.
+
+    Independent calls are scheduled together so IO-bound tools overlap instead
+    of serializing behind each other. `max_concurrency` caps how many run at
+    once; `None` leaves the fan-out unbounded.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or max(len(tool_calls), 1))
+
+    async def _run_one(call) -> Any:
         if not isinstance(call, ToolCall):
-            results.append({"error": "Invalid tool call format"})
-            continue
+            return {"error": "Invalid tool call format"}
         name, args = call.name, call.args
         tool = tool_map.get(name)
-        if tool and name not in blacklist:
-            try:
-                res = tool.run(**args)
-                if inspect.iscoroutine(res):
-                    res = await res
-                results.append({"name": name, "result": res})
-            except Exception as e:
-                results.append({"name": name, "error": str(e)})
-        else:
-            results.append({"name": name, "error": "Tool not registered or blacklisted"})
-    return results
+        if not tool or name in blacklist:
+            return {"name": name, "error": "Tool not registered or blacklisted"}
+        try:
+            async with semaphore:
+                # `is_async` is known at registration, so skip the
+                # inspect.iscoroutine() probe on every result.
+                res = await tool.run(**args) if tool.is_async else tool.run(**args)
+            return {"name": name, "result": res}
+        except Exception as e:
+            return {"name": name, "error": str(e)}
+
+    return list(await asyncio.gather(*(_run_one(call) for call in tool_calls)))
 
 
 def invoke(model, prompt: Optional[str], role: str = "user", images=None, audio=None,
            autorun: bool = None, automem: bool = None, **kwargs) -> ResponseMem:
-    if role not in ("user", "assistant", "system"):
+    if role not in _VALID_ROLES:
         raise ValueError("Role must be one of 'user', 'assistant', or 'system'")
 
-    created = datetime.now().astimezone(timezone.utc)
-    memory = model.llm.invoke(prompt=prompt, role=role, images=images, audio=audio, **kwargs)
+    _autorun, _automem = _resolve_flags(model, autorun, automem)
 
-    _autorun = autorun if autorun is not None else model.autorun
-    _automem = automem if automem is not None else model.automem
+    key = _cache_key(model, prompt, role, kwargs, images, audio)
+    if key is not None:
+        cached = model.cache.get(key)
+        if cached is not None:
+            # Clone so callers mutating tool_results don't corrupt the cache.
+            memory = _clone_mem(cached)
+            if _automem and model.history:
+                model.history.add(UserMem(message=prompt, role=role,
+                                          created=datetime.now(timezone.utc)))
+                model.history.add(memory)
+            return memory
+
+    if kwargs:
+        memory = model.llm.invoke(prompt=prompt, role=role, images=images, audio=audio, **kwargs)
+    else:
+        # Skip the **kwargs repack on the common no-extras call.
+        memory = model.llm.invoke(prompt=prompt, role=role, images=images, audio=audio)
 
     if _autorun and memory.tool_calls:
-        if any(t.is_async for t in model.llm.synaptic_tools):
+        if model.llm._has_async_tool:
             raise RuntimeError("invoke() cannot run async tools; use ainvoke()")
-        memory.tool_results = run_tools_sync(model.llm.synaptic_tools, model.blacklist, memory.tool_calls)
+        memory.tool_results = run_tools_sync(model.llm.tool_map, model.blacklist, memory.tool_calls,
+                                             parallel=model.parallel_tools)
     else:
         memory.tool_results = []
 
+    if key is not None:
+        model.cache.set(key, _clone_mem(memory))
+
     if _automem and model.history and prompt is not None:
-        model.history.add(UserMem(message=prompt, role=role, created=created))
+        # Timestamp only at persist time; the default automem=False path
+        # never pays for the clock read.
+        model.history.add(UserMem(message=prompt, role=role, created=memory.created))
         model.history.add(memory)
 
     return memory
@@ -76,30 +166,51 @@ def invoke(model, prompt: Optional[str], role: str = "user", images=None, audio=
 
 async def ainvoke(model, prompt: Optional[str], role: str = "user", images=None, audio=None,
                   autorun: bool = None, automem: bool = None, **kwargs) -> ResponseMem:
-    if role not in ("user", "assistant", "system"):
+    if role not in _VALID_ROLES:
         raise ValueError("Role must be one of 'user', 'assistant', or 'system'")
 
-    created = datetime.now().astimezone(timezone.utc)
-    _autorun = autorun if autorun is not None else model.autorun
-    _automem = automem if automem is not None else model.automem
+    created = datetime.now(timezone.utc)
+    _autorun, _automem = _resolve_flags(model, autorun, automem)
 
-    # Drive the native async stream to completion and collect the full response.
-    # This gives true async execution without blocking the event loop.
-    accumulated = ""
-    tool_calls: List[ToolCall] = []
-    async for chunk in model.llm.astream(prompt=prompt, role=role, images=images, audio=audio, **kwargs):
-        if not chunk.is_final and chunk.text:
-            accumulated += chunk.text
-        if chunk.function_call:
-            tool_calls.append(chunk.function_call)
+    key = _cache_key(model, prompt, role, kwargs, images, audio)
+    if key is not None:
+        cached = model.cache.get(key)
+        if cached is not None:
+            memory = _clone_mem(cached)
+            if _automem and model.history:
+                model.history.add(UserMem(message=prompt, role=role, created=created))
+                model.history.add(memory)
+            return memory
+
+    llm = model.llm
+    if hasattr(llm, "ainvoke"):
+        # Native async call: one request, usage metadata included.
+        memory = await llm.ainvoke(prompt=prompt, role=role, images=images, audio=audio, **kwargs)
+    else:
+        # Fall back to driving the async stream to completion. Accumulate
+        # chunks in a list: += on str recopies the whole prefix each time,
+        # which goes quadratic on long generations.
+        parts: List[str] = []
+        tool_calls: List[ToolCall] = []
+        async for chunk in llm.astream(prompt=prompt, role=role, images=images, audio=audio, **kwargs):
+            if not chunk.is_final and chunk.text:
+                parts.append(chunk.text)
+            if chunk.function_call:
+                tool_calls.append(chunk.function_call)
 
-    memory = ResponseMem(message=accumulated, created=created, tool_calls=tool_calls)
+        memory = ResponseMem(message="".join(parts), created=created, tool_calls=tool_calls)
 
     if _autorun and memory.tool_calls:
-        memory.tool_results = await run_tools_async(model.llm.synaptic_tools, model.blacklist, memory.tool_calls)
+        memory.tool_results = await run_tools_async(
+            model.llm.tool_map, model.blacklist, memory.tool_calls,
+            max_concurrency=model.max_concurrency,
+        )
     else:
         memory.tool_results = []
 
+    if key is not None:
+        model.cache.set(key, _clone_mem(memory))
+
     if _automem and model.history and prompt is not None:
         model.history.add(UserMem(message=prompt, role=role, created=created))
         model.history.add(memory)
@@ -107,40 +218,191 @@ async def ainvoke(model, prompt: Optional[str], role: str = "user", images=None,
     return memory
 
 
+def invoke_many(model, prompts: List[str], role: str = "user",
+                autorun: bool = None, automem: bool = None, **kwargs) -> List[ResponseMem]:
+    # Batches from parallel agent branches often repeat the same prompt;
+    # within one batch the answer would be identical, so call the provider
+    # once per distinct prompt and hand duplicates copies of the result.
+    _, _automem = _resolve_flags(model, None, automem)
+    by_prompt: Dict[str, ResponseMem] = {}
+    memories: List[ResponseMem] = []
+    for prompt in prompts:
+        memory = by_prompt.get(prompt)
+        if memory is None:
+            memory = by_prompt[prompt] = invoke(model, prompt, role=role,
+                                                autorun=autorun, automem=False, **kwargs)
+        else:
+            # Copy so callers mutating one result don't alias its duplicates.
+            memory = copy.copy(memory)
+        memories.append(memory)
+
+    if _automem and model.history:
+        for prompt, memory in zip(prompts, memories):
+            model.history.add(UserMem(message=prompt, role=role, created=memory.created))
+            model.history.add(memory)
+
+    return memories
+
+
+async def ainvoke_many(model, prompts: List[str], role: str = "user",
+                       autorun: bool = None, automem: bool = None, **kwargs) -> List[ResponseMem]:
+    _, _automem = _resolve_flags(model, None, automem)
+    # One provider call per distinct prompt; duplicates are scattered back
+    # to their original indices as copies.
+    unique_prompts = list(dict.fromkeys(prompts))
+    semaphore = asyncio.Semaphore(model.max_concurrency or max(len(unique_prompts), 1))
+
+    async def _one(prompt: str) -> ResponseMem:
+        async with semaphore:
+            if model.rate_limiter is not None:
+                # ~4 chars/token is a coarse but serviceable estimate for pacing.
+                await model.rate_limiter.acquire(len(prompt) // 4 + model.max_tokens)
+            return await ainvoke(model, prompt, role=role, autorun=autorun, automem=False, **kwargs)
+
+    by_prompt = dict(zip(unique_prompts, await asyncio.gather(*(_one(p) for p in unique_prompts))))
+    seen: set = set()
+    memories: List[ResponseMem] = []
+    for prompt in prompts:
+        memory = by_prompt[prompt]
+        if prompt in seen:
+            memory = copy.copy(memory)
+        else:
+            seen.add(prompt)
+        memories.append(memory)
+
+    # History writes happen after the fan-out so entries land in input order
+    # instead of interleaving by completion time.
+    if _automem and model.history:
+        for prompt, memory in zip(prompts, memories):
+            model.history.add(UserMem(message=prompt, role=role, created=memory.created))
+            model.history.add(memory)
+
+    return memories
+
+
+_ROWMARSHAL_HEADER = (
+    "Answer each of the following {n} prompts independently. "
+    "Respond with ONLY a JSON array of exactly {n} strings, where element i "
+    "is the answer to prompt i. No other text.\n"
+)
+
+
+def _parse_rowmarshal(message: str, n: int) -> Optional[List[str]]:
+    """Extract the JSON answer array from a marshalled response, or None."""
+    text = message.strip()
+    if text.startswith("```"):
+        # Models fenced into markdown wrap the array in ```json ... ```.
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+    try:
+        answers = _json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(answers, list) or len(answers) != n:
+        return None
+    return [a if isinstance(a, str) else _json.dumps(a).decode() for a in answers]
+
+
+def invoke_rowmarshal(model, prompts: List[str], batch_size: int = 10,
+                      role: str = "user", **kwargs) -> List[ResponseMem]:
+    """Marshal several independent prompts into one provider call per batch.
+
+    Each batch of `batch_size` prompts is numbered into a single prompt that
+    asks for a JSON array of answers, which is then split back into one
+    `ResponseMem` per prompt — one round-trip and one RPM-quota hit instead of
+    `batch_size`. Batch token usage is reported on the first memory of each
+    batch. A batch whose response doesn't parse as the expected array falls
+    back to plain per-prompt `invoke` calls, so callers always get
+    `len(prompts)` results in input order. Tools and automem are deliberately
+    out of scope here: marshalled answers have no per-prompt tool calls and
+    would interleave nonsensically in history.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    memories: List[ResponseMem] = []
+    for start in range(0, len(prompts), batch_size):
+        batch = prompts[start:start + batch_size]
+        if len(batch) == 1:
+            memories.append(invoke(model, batch[0], role=role,
+                                   autorun=False, automem=False, **kwargs))
+            continue
+
+        combined = _ROWMARSHAL_HEADER.format(n=len(batch)) + "\n".join(
+            f"{i}. {p}" for i, p in enumerate(batch, start=1)
+        )
+        batch_mem = invoke(model, combined, role=role,
+                           autorun=False, automem=False, **kwargs)
+        answers = _parse_rowmarshal(batch_mem.message, len(batch))
+        if answers is None:
+            memories.extend(invoke(model, p, role=role,
+                                   autorun=False, automem=False, **kwargs)
+                            for p in batch)
+            continue
+
+        for i, answer in enumerate(answers):
+            mem = ResponseMem(
+                message=answer, created=batch_mem.created, tool_calls=[],
+                input_tokens=batch_mem.input_tokens if i == 0 else 0,
+                output_tokens=batch_mem.output_tokens if i == 0 else 0,
+            )
+            mem.tool_results = []
+            memories.append(mem)
+
+    return memories
+
+
 async def astream(model, prompt: Optional[str], role: str = "user", images=None, audio=None,
                   autorun: bool = None, automem: bool = None, abort=None, **kwargs):
-    if role not in ("user", "assistant", "system"):
+    if role not in _VALID_ROLES:
         raise ValueError("Role must be one of 'user', 'assistant', or 'system'")
 
     if not hasattr(model.llm, "astream"):
         raise NotImplementedError("Underlying model does not implement astream()")
 
-    _autorun = autorun if autorun is not None else model.autorun
-    _automem = automem if automem is not None else model.automem
+    _autorun, _automem = _resolve_flags(model, autorun, automem)
 
-    created = datetime.now().astimezone(timezone.utc)
-    accumulated = ""
+    created = datetime.now(timezone.utc)
+    parts: List[str] = []
     tool_calls: List[ToolCall] = []
     tool_results: List[Any] = []
+    pending: List[asyncio.Task] = []
+    # Shared gate so a burst of streamed function_calls can't spawn an
+    # unbounded number of concurrent tool tasks.
+    tool_sem = asyncio.Semaphore(model.max_concurrency) if model.max_concurrency else None
+
+    async def _run_one_guarded(call: ToolCall) -> List[Any]:
+        if tool_sem is None:
+            return await run_tools_async(model.llm.tool_map, model.blacklist, [call])
+        async with tool_sem:
+            return await run_tools_async(model.llm.tool_map, model.blacklist, [call])
 
     async for chunk in model.llm.astream(prompt=prompt, role=role, images=images, audio=audio, abort=abort, **kwargs):
         if abort and abort.is_set():
+            for task in pending:
+                task.cancel()
             return
         yield chunk
 
         if getattr(chunk, "text", None) and not chunk.is_final:
-            accumulated += chunk.text
+            parts.append(chunk.text)
 
         if getattr(chunk, "function_call", None):
             tool_calls.append(chunk.function_call)
             if _autorun:
-                try:
-                    tr = await run_tools_async(model.llm.synaptic_tools, model.blacklist, [chunk.function_call])
-                    tool_results.extend(tr)
-                except Exception as e:
-                    tool_results.append({"name": chunk.function_call.name, "error": str(e)})
+                # Start the tool right away so it executes while the model is
+                # still streaming the rest of the response.
+                pending.append(asyncio.create_task(_run_one_guarded(chunk.function_call)))
+
+    for call, res in zip(tool_calls, await asyncio.gather(*pending, return_exceptions=True)):
+        if isinstance(res, BaseException):
+            tool_results.append({"name": call.name, "error": str(res)})
+        else:
+            tool_results.extend(res)
 
-    final_mem = ResponseMem(message=accumulated, created=created, tool_calls=tool_calls)
+    final_mem = ResponseMem(message="".join(parts), created=created, tool_calls=tool_calls)
     final_mem.tool_results = tool_results
 
     if _automem and model.history and prompt is not None:
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Optional
 import enum
 
@@ -33,6 +34,27 @@ class ResponseChunk:
 
 
 class BaseModel(ABC):
+    def _invalidate_tools(self) -> None:
+        """Rebuild provider tool schemas and the cached name → Tool index.
+
+        Runs once per tool mutation (bind/registry change) so per-call code
+        can do O(1) lookups in `tool_map` instead of re-deriving it. A
+        fingerprint of the registry version and the bound-tool identities
+        makes repeat notifications with an unchanged tool set O(1) instead
+        of a full schema reconversion.
+        """
+        from ..tool import _default_registry
+
+        registry = getattr(self, "tool_registry", None) or _default_registry
+        fingerprint = (registry._version,
+                       tuple(map(id, getattr(self, "bound_tools", None) or ())))
+        if fingerprint == getattr(self, "_tools_fingerprint", None):
+            return
+        self._tools_fingerprint = fingerprint
+        self._convert_tools()
+        self.tool_map = MappingProxyType({t.name: t for t in self.synaptic_tools})
+        self._has_async_tool = any(t.is_async for t in self.synaptic_tools)
+
     @abstractmethod
     def invoke(self, prompt: Optional[str], **kwargs) -> ResponseMem:
         pass
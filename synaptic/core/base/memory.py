@@ -1,14 +1,18 @@
+import bisect
 import copy
-import json
 import warnings
-from typing import Callable, Dict, List, Optional
+from collections import deque
+from typing import Callable, Deque, Dict, List, Literal, Optional
 
+from .. import _json
 from ..tool import ToolCall
 
 
 class Memory:
     """Single conversation entry with a role and timestamp."""
 
+    __slots__ = ("message", "created", "role")
+
     def __init__(self, message: str, created, role: str):
         self.message = message
         self.created = created
@@ -21,21 +25,42 @@ class Memory:
 class ResponseMem(Memory):
     """Assistant memory that may include tool calls and tool results."""
 
+    __slots__ = ("_tool_calls", "_tool_results", "input_tokens", "output_tokens", "_repr_cache")
+
     def __init__(
         self,
         message: str,
         created,
-        tool_calls: List[ToolCall] = None,
-        tool_results: List = None,
+        tool_calls: Optional[List[ToolCall]] = None,
+        tool_results: Optional[List] = None,
         role: str = "assistant",
         input_tokens: int = 0,
         output_tokens: int = 0,
     ):
         super().__init__(message, created, role)
-        self.tool_calls: List[ToolCall] = tool_calls or []
-        self.tool_results: List = tool_results or []
+        self._tool_calls: List[ToolCall] = tool_calls or []
+        self._tool_results: List = tool_results or []
         self.input_tokens: int = input_tokens
         self.output_tokens: int = output_tokens
+        self._repr_cache: Optional[str] = None
+
+    @property
+    def tool_calls(self) -> List[ToolCall]:
+        return self._tool_calls
+
+    @tool_calls.setter
+    def tool_calls(self, value: List[ToolCall]) -> None:
+        self._tool_calls = value
+        self._repr_cache = None
+
+    @property
+    def tool_results(self) -> List:
+        return self._tool_results
+
+    @tool_results.setter
+    def tool_results(self, value: List) -> None:
+        self._tool_results = value
+        self._repr_cache = None
 
     def list_tool_calls(self) -> List[str]:
         return [tc.name for tc in self.tool_calls]
@@ -47,12 +72,20 @@ class ResponseMem(Memory):
         return matches[0]
 
     def __repr__(self):
-        return f"<ResponseMem role={self.role} message={self.message!r} tool_calls={self.tool_calls}>"
+        # Repeated rendering (debug logs, UI refreshes) re-formats every tool
+        # call each time; cache until tool_calls/tool_results are reassigned.
+        if self._repr_cache is None:
+            self._repr_cache = (
+                f"<ResponseMem role={self.role} message={self.message!r} tool_calls={self._tool_calls}>"
+            )
+        return self._repr_cache
 
 
 class UserMem(Memory):
     """User or system memory entry; defaults to role `user`."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, created, role: str = "user"):
         super().__init__(message, created, role)
 
@@ -65,6 +98,12 @@ class History:
 
     When the window drops entries, `on_truncate` receives the removed memories.
     Without a callback, truncation emits a warning so lost context is visible.
+
+    `mode="sliding"` evicts one entry per add once the window is full, so the
+    window start shifts on every turn. `mode="append_only"` lets the window
+    grow to twice `size` and then cuts back in one batch; between cuts every
+    request shares a byte-identical prefix with the previous one, which keeps
+    provider-side prompt caches hitting on long sessions.
     """
 
     def __init__(
@@ -73,17 +112,27 @@ class History:
         size: int = 10,
         on_truncate: Optional[Callable[[List[Memory]], None]] = None,
         dedup_tools: bool = False,
+        mode: Literal["sliding", "append_only"] = "sliding",
     ):
-        self.MemoryList: List[Memory] = list(memoryList or [])
+        # A deque makes eviction from the front O(1); a list shifts every
+        # remaining entry on each truncation.
+        self.MemoryList: Deque[Memory] = deque(memoryList or ())
         self.size = size
         self.on_truncate = on_truncate
         self.dedup_tools = dedup_tools
+        self.mode = mode
+        # Bumped whenever entries are dropped from the front. Appends don't
+        # count, so adapters can cache converted history and only convert the
+        # tail delta while this stays unchanged.
+        self._structure_rev = 0
 
     def _size_update(self) -> None:
+        if self.mode == "append_only" and len(self.MemoryList) < 2 * self.size:
+            return
         excess = len(self.MemoryList) - self.size
         if excess > 0:
-            dropped = self.MemoryList[:excess]
-            self.MemoryList = self.MemoryList[excess:]
+            self._structure_rev += 1
+            dropped = [self.MemoryList.popleft() for _ in range(excess)]
             if self.on_truncate:
                 self.on_truncate(dropped)
             else:
@@ -94,10 +143,24 @@ class History:
                     stacklevel=3,
                 )
 
-    def window(self, size: int) -> List[Memory]:
+    def trim(self, size: int) -> None:
+        """Resize the window without materializing the remaining entries."""
         self.size = size
         self._size_update()
-        return self.MemoryList
+
+    def window(self, size: int) -> List[Memory]:
+        self.trim(size)
+        return list(self.MemoryList)
+
+    def window_since(self, cutoff) -> List[Memory]:
+        """Return memories created at or after `cutoff` (a datetime).
+
+        Entries are append-ordered, so created timestamps are monotonic and a
+        binary search finds the boundary without scanning every entry.
+        """
+        mems = list(self.MemoryList)
+        start = bisect.bisect_left(mems, cutoff, key=lambda m: m.created)
+        return mems[start:]
 
     def add(self, memory: Memory) -> None:
         self.MemoryList.append(memory)
@@ -112,10 +175,10 @@ class History:
         is dropped entirely.
         """
         if not self.dedup_tools:
-            return self.MemoryList
+            return list(self.MemoryList)
 
         def _key(call: ToolCall) -> str:
-            return f"{call.name}\x00{json.dumps(call.args, sort_keys=True, default=str)}"
+            return f"{call.name}\x00{_json.dumps(call.args, sort_keys=True, default=str).decode()}"
 
         # Forward pass: record the last index each (name, args) key appears at.
         last: Dict[str, int] = {}
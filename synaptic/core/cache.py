@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+
+class CacheBackend(Protocol):
+    """Storage interface for the deterministic response cache.
+
+    Implement this to back the cache with something other than process
+    memory (Redis, disk, ...). `get` returns `None` on a miss.
+    """
+
+    def get(self, key: str) -> Optional[Any]: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class LRUCacheBackend:
+    """In-memory LRU cache with optional per-entry TTL."""
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires is not None and time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
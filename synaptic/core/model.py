@@ -1,9 +1,12 @@
+import threading
 from typing import Any, List, Optional
 
 from . import _runner as _r
 from ._factory import build_adapter
 from .base import History, ResponseFormat, ResponseMem
+from .cache import CacheBackend, LRUCacheBackend
 from .provider import Provider
+from .throttle import AsyncRateLimiter
 from .tool import Tool, ToolRegistry
 
 
@@ -16,6 +19,17 @@ class Model:
     loop that continues after tools return results.
     """
 
+    # Batch-agent workloads allocate a Model per session; slots drop the
+    # per-instance __dict__. Subclasses adding attributes must declare their
+    # own __slots__ (or omit it to get a __dict__ back).
+    __slots__ = (
+        "provider", "model", "temperature", "api_key", "max_tokens", "tools",
+        "autorun", "automem", "blacklist", "max_concurrency", "parallel_tools",
+        "rate_limiter", "cache", "response_format", "response_schema",
+        "location", "project", "base_url", "tool_registry",
+        "_instructions", "_history", "_llm", "_llm_lock", "_adapter_kwargs",
+    )
+
     def __init__(
         self,
         provider: Provider,
@@ -28,6 +42,10 @@ class Model:
         autorun: bool = False,
         automem: bool = False,
         blacklist: List[str] | None = None,
+        max_concurrency: Optional[int] = None,
+        parallel_tools: bool = False,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
         location: Optional[str] = None,
         project: Optional[str] = None,
         instructions: str = "",
@@ -35,6 +53,9 @@ class Model:
         response_schema: Any = None,
         base_url: Optional[str] = None,
         tool_registry: Optional[ToolRegistry] = None,
+        enable_cache: bool = False,
+        cache_backend: Optional[CacheBackend] = None,
+        cache_ttl: Optional[float] = None,
     ) -> None:
         self.provider = provider
         self.model = model
@@ -43,11 +64,31 @@ class Model:
         self.max_tokens = max_tokens
         self.autorun = autorun
         self.automem = automem
-        self.blacklist = blacklist or []
+        # frozenset makes the per-tool-call membership check O(1).
+        self.blacklist = frozenset(blacklist or ())
+        self.max_concurrency = max_concurrency
+        self.parallel_tools = parallel_tools
+        self.rate_limiter = (
+            AsyncRateLimiter(max_requests_per_minute, max_tokens_per_minute)
+            if max_requests_per_minute or max_tokens_per_minute else None
+        )
+        # Deterministic calls (temperature 0, no extra kwargs) can be served
+        # from memory instead of re-hitting the provider.
+        self.cache = (cache_backend or LRUCacheBackend(ttl=cache_ttl)) if enable_cache else None
         self.response_format = response_format
         self.response_schema = response_schema
-        if self.response_format != ResponseFormat.NONE and self.response_schema is None:
-            raise ValueError("Response schema must be provided for structured response formats")
+        if self.response_format != ResponseFormat.NONE:
+            if self.response_schema is None:
+                raise ValueError("Response schema must be provided for structured response formats")
+            # Fail at construction, not on the first provider call: adapters
+            # expect either a JSON-schema dict or a pydantic-style model.
+            if not isinstance(self.response_schema, dict) and not hasattr(
+                self.response_schema, "model_json_schema"
+            ):
+                raise ValueError(
+                    "Response schema must be a JSON-schema dict or a class "
+                    "with model_json_schema() (e.g. a pydantic model)"
+                )
         self.location = location
         self.project = project
         self.base_url = base_url
@@ -56,7 +97,12 @@ class Model:
         self._history = history or History()
 
         adapter_tools = (tools or []) if self.response_format == ResponseFormat.NONE else None
-        self.llm = build_adapter(
+        self.tools = adapter_tools
+        # Adapter construction pays for HTTP clients and tool-schema
+        # translation, so defer it until something actually needs the provider.
+        self._llm = None
+        self._llm_lock = threading.Lock()
+        self._adapter_kwargs = dict(
             provider=provider,
             model=model,
             temperature=temperature,
@@ -72,16 +118,31 @@ class Model:
             base_url=base_url,
             tool_registry=tool_registry,
         )
-        self.llm._invalidate_tools()
-        self.tools = self.llm.synaptic_tools
 
         if not self.automem:
-            self._history.window(1)
+            # trim, not window: no point copying out entries we're discarding.
+            self._history.trim(1)
 
     # ------------------------------------------------------------------ #
     # Properties                                                           #
     # ------------------------------------------------------------------ #
 
+    @property
+    def llm(self) -> Any:
+        """The provider adapter, constructed on first use."""
+        if self._llm is None:
+            with self._llm_lock:
+                if self._llm is None:
+                    llm = build_adapter(**self._adapter_kwargs)
+                    # Re-apply anything the setters changed before first use.
+                    # No _invalidate_tools here: the adapter constructor
+                    # already converted its tools and built the map.
+                    llm.history = self._history
+                    llm.instructions = self._instructions
+                    self.tools = llm.synaptic_tools
+                    self._llm = llm
+        return self._llm
+
     @property
     def history(self) -> History:
         return self._history
@@ -89,8 +150,8 @@ class Model:
     @history.setter
     def history(self, value: History) -> None:
         self._history = value
-        if hasattr(self, "llm"):
-            self.llm.history = value
+        if self._llm is not None:
+            self._llm.history = value
 
     @property
     def instructions(self) -> str:
@@ -99,8 +160,8 @@ class Model:
     @instructions.setter
     def instructions(self, value: str) -> None:
         self._instructions = value
-        if hasattr(self, "llm"):
-            self.llm.instructions = value
+        if self._llm is not None:
+            self._llm.instructions = value
 
     # ------------------------------------------------------------------ #
     # Tool binding                                                         #
@@ -108,13 +169,14 @@ class Model:
 
     def bind_tools(self, tools: List[Tool]) -> None:
         """Attach tools directly to this model and refresh adapter schemas."""
+        llm = self.llm  # materialize the adapter before touching its tool lists
         if self.tools is None:
             self.tools = []
         self.tools += tools
-        if hasattr(self.llm, "bound_tools"):
-            self.llm.bound_tools = self.tools
-        self.llm.synaptic_tools = self.tools
-        self.llm._invalidate_tools()
+        if hasattr(llm, "bound_tools"):
+            llm.bound_tools = self.tools
+        llm.synaptic_tools = self.tools
+        llm._invalidate_tools()
 
     # ------------------------------------------------------------------ #
     # Invoke / stream delegation                                           #
@@ -138,6 +200,40 @@ class Model:
         return await _r.ainvoke(self, prompt, role=role, images=images, audio=audio,
                                 autorun=autorun, automem=automem, **kwargs)
 
+    def invoke_many(
+        self, prompts: List[str], role: str = "user",
+        autorun: bool = None, automem: bool = None, **kwargs,
+    ) -> List[ResponseMem]:
+        """Run provider calls for several prompts sequentially.
+
+        Synchronous convenience wrapper; use `ainvoke_many` to overlap the
+        round-trips.
+        """
+        return _r.invoke_many(self, prompts, role=role,
+                              autorun=autorun, automem=automem, **kwargs)
+
+    def invoke_rowmarshal(
+        self, prompts: List[str], batch_size: int = 10, role: str = "user", **kwargs,
+    ) -> List[ResponseMem]:
+        """Answer many short independent prompts in `len(prompts)/batch_size` calls.
+
+        Batches are marshalled into one JSON-array request each, so throughput
+        is no longer bounded by per-request RPM quotas. Results arrive in
+        input order; an unparseable batch falls back to individual calls.
+        """
+        return _r.invoke_rowmarshal(self, prompts, batch_size=batch_size, role=role, **kwargs)
+
+    async def ainvoke_many(
+        self, prompts: List[str], role: str = "user",
+        autorun: bool = None, automem: bool = None, **kwargs,
+    ) -> List[ResponseMem]:
+        """Run provider calls for several prompts concurrently.
+
+        Results come back in input order; `max_concurrency` bounds the fan-out.
+        """
+        return await _r.ainvoke_many(self, prompts, role=role,
+                                     autorun=autorun, automem=automem, **kwargs)
+
     async def astream(
         self, prompt: Optional[str], role: str = "user",
         images: Optional[List[str]] = None, audio: Optional[List[str]] = None,
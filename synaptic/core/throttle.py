@@ -0,0 +1,77 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """Token-bucket pacing for request and token budgets per minute.
+
+    Capacity refills continuously with elapsed wall time, so `acquire` sleeps
+    just long enough to stay under the configured limits instead of blasting
+    the provider and burning round-trips on 429 retries. A 429 can still be
+    reported via `cooldown`, which pauses all acquirers until it passes.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_capacity = requests_per_minute or 0.0
+        self._token_capacity = tokens_per_minute or 0.0
+        self._last_refill = time.monotonic()
+        self._cooldown_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._request_capacity = min(
+                self.requests_per_minute,
+                self._request_capacity + elapsed * self.requests_per_minute / 60.0,
+            )
+        if self.tokens_per_minute:
+            self._token_capacity = min(
+                self.tokens_per_minute,
+                self._token_capacity + elapsed * self.tokens_per_minute / 60.0,
+            )
+
+    def cooldown(self, seconds: float) -> None:
+        """Pause all acquirers for `seconds`, e.g. after a 429 response."""
+        self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    async def acquire(self, estimated_tokens: int = 0) -> None:
+        """Block until one request plus `estimated_tokens` fit in the budget."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                if now >= self._cooldown_until:
+                    self._refill()
+                    need_request = 1.0 if self.requests_per_minute else 0.0
+                    # Clamp to bucket size: an estimate above tokens_per_minute
+                    # could never fit and would retry forever, so let it drain
+                    # a full bucket instead.
+                    need_tokens = (
+                        min(float(estimated_tokens), self.tokens_per_minute)
+                        if self.tokens_per_minute else 0.0
+                    )
+                    if (self._request_capacity >= need_request
+                            and self._token_capacity >= need_tokens):
+                        self._request_capacity -= need_request
+                        self._token_capacity -= need_tokens
+                        return
+                    waits = []
+                    if self.requests_per_minute and self._request_capacity < need_request:
+                        waits.append((need_request - self._request_capacity)
+                                     * 60.0 / self.requests_per_minute)
+                    if self.tokens_per_minute and self._token_capacity < need_tokens:
+                        waits.append((need_tokens - self._token_capacity)
+                                     * 60.0 / self.tokens_per_minute)
+                    wait = max(waits)
+                else:
+                    wait = self._cooldown_until - now
+            await asyncio.sleep(wait)
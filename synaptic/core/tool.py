@@ -1,7 +1,14 @@
+import functools
+import hashlib
 import inspect
+import sys
 import types
+import weakref
+from contextlib import contextmanager
 from typing import Any, Callable, Dict, List, Optional
 
+from . import _json
+
 
 class ToolRegistry:
     """Collection of tools for one model, agent, session, or application."""
@@ -9,21 +16,29 @@ class ToolRegistry:
     def __init__(self) -> None:
         self._tools: Dict[str, "Tool"] = {}
         self._callbacks: List[Callable[[], None]] = []
+        self._suppressed = False
+        self._pending_notify = False
+        # Bumped on every mutation; adapters compare it to skip rebuilding
+        # their converted tool schemas when nothing actually changed.
+        self._version = 0
 
     def register(self, tool: "Tool") -> None:
         """Add or replace a tool by name and notify adapter subscribers."""
         self._tools[tool.name] = tool
+        self._version += 1
         self._notify()
 
     def register_many(self, tools: List["Tool"]) -> None:
         for tool in tools:
             self._tools[tool.name] = tool
         if tools:
+            self._version += 1
             self._notify()
 
     def unregister(self, name: str) -> None:
         if name in self._tools:
             del self._tools[name]
+            self._version += 1
             self._notify()
 
     def unregister_prefix(self, prefix: str) -> None:
@@ -31,14 +46,53 @@ class ToolRegistry:
         for name in names:
             del self._tools[name]
         if names:
+            self._version += 1
             self._notify()
 
     def _notify(self) -> None:
-        for cb in self._callbacks:
-            cb()
+        # Each subscriber reconverts its whole tool list, so skip the fan-out
+        # entirely when nobody is listening and coalesce it while suppressed.
+        if not self._callbacks:
+            return
+        if self._suppressed:
+            self._pending_notify = True
+            return
+        dead = False
+        for ref in self._callbacks:
+            cb = ref()
+            if cb is None:
+                dead = True
+            else:
+                cb()
+        if dead:
+            self._callbacks = [ref for ref in self._callbacks if ref() is not None]
+
+    @contextmanager
+    def suppress_notifications(self):
+        """Batch registrations; subscribers get one notification on exit.
+
+        Registering M tools against N subscribed adapters normally costs
+        M*N tool-list rebuilds; inside this context it costs N.
+        """
+        self._suppressed = True
+        self._pending_notify = False
+        try:
+            yield self
+        finally:
+            self._suppressed = False
+            if self._pending_notify:
+                self._pending_notify = False
+                self._notify()
 
     def on_change(self, fn: Callable[[], None]) -> None:
-        self._callbacks.append(fn)
+        # Bound methods (adapter._invalidate_tools) are held weakly; a strong
+        # reference would pin every adapter ever constructed and fan each
+        # registry change out to all of them forever. Dead subscribers are
+        # pruned on the next notification. Plain functions keep a strong ref.
+        if getattr(fn, "__self__", None) is not None:
+            self._callbacks.append(weakref.WeakMethod(fn))
+        else:
+            self._callbacks.append(lambda fn=fn: fn)
 
     def all(self) -> Dict[str, "Tool"]:
         return self._tools
@@ -71,19 +125,22 @@ def collect_tools(
     registry: Optional[ToolRegistry] = None,
 ) -> Dict[str, "Tool"]:
     """Merge explicit tools with a registry, preferring explicit tools."""
-    all_tools: Dict[str, "Tool"] = {}
-    for tool in tools or []:
-        all_tools[tool.name] = tool
     source = registry.all() if registry is not None else TOOL_REGISTRY
-    for name, tool in source.items():
-        if name not in all_tools:
-            all_tools[name] = tool
-    return all_tools
+    if not tools:
+        return dict(source)
+    # One C-level merge instead of a membership probe per registry tool;
+    # explicit tools overwrite registry entries of the same name.
+    return {**source, **{tool.name: tool for tool in tools}}
 
 
 class Tool:
     """Callable exposed to model providers through function/tool calling."""
 
+    # Tool and ToolCall instances are created per call in agent loops;
+    # __slots__ drops the per-instance __dict__ and speeds attribute access.
+    __slots__ = ("name", "declaration", "function", "is_async", "default_params", "run",
+                 "_declaration_json", "_declaration_hash", "_repr")
+
     def __init__(
         self,
         name: str,
@@ -93,19 +150,58 @@ class Tool:
         add_to_registry: bool = True,
         registry: Optional[ToolRegistry] = None,
     ) -> None:
-        self.name = name
+        # Interned names make registry/tool_map probes pointer-equality
+        # compares; names from parsed provider JSON aren't interned by default.
+        self.name = sys.intern(name)
+        if isinstance(declaration.get("name"), str):
+            declaration["name"] = sys.intern(declaration["name"])
         self.declaration = declaration
         if not callable(function):
             raise ValueError("Function must be a callable")
         self.function = function
-        self.is_async = inspect.iscoroutinefunction(function)
+        # Plain functions answer "is this a coroutine function" from one code
+        # flag; inspect.iscoroutinefunction pays for unwrap/marker handling
+        # that only matters for exotic callables, so keep it as the fallback.
+        code = getattr(function, "__code__", None)
+        self.is_async = (
+            bool(code.co_flags & inspect.CO_COROUTINE)
+            if code is not None
+            else inspect.iscoroutinefunction(function)
+        )
         self.default_params = default_params or {}
+        # Serialized lazily on first use; see declaration_json.
+        self._declaration_json: Optional[bytes] = None
+        self._declaration_hash: Optional[bytes] = None
+        self._repr: Optional[str] = None
 
         if add_to_registry:
             target = registry or _default_registry
             target.register(self)
 
-        self.run = self._run_async if self.is_async else self._run_sync
+        # With no defaults to merge the wrappers add nothing but dict churn,
+        # so bind the callable itself as the per-call entry point.
+        if self.default_params:
+            self.run = self._run_async if self.is_async else self._run_sync
+        else:
+            self.run = self.function
+
+    @property
+    def declaration_json(self) -> bytes:
+        """The declaration serialized once, reused across calls.
+
+        Adapters re-serializing the same declaration per request can send
+        these bytes instead of paying json.dumps every time.
+        """
+        if self._declaration_json is None:
+            self._declaration_json = _json.dumps(self.declaration, sort_keys=True, default=str)
+        return self._declaration_json
+
+    @property
+    def declaration_hash(self) -> bytes:
+        """Short stable digest of the declaration, e.g. for cache keys."""
+        if self._declaration_hash is None:
+            self._declaration_hash = hashlib.blake2b(self.declaration_json, digest_size=8).digest()
+        return self._declaration_hash
 
     def __get__(self, instance, owner):
         """Bind decorated methods to their instance without re-registering."""
@@ -119,21 +215,33 @@ class Tool:
             add_to_registry=False,
         )
 
+    def __repr__(self):
+        # Declarations are immutable after __init__, so format once.
+        if self._repr is None:
+            params = sorted(self.declaration.get("parameters", {}).get("properties", {}))
+            self._repr = f"<Tool name={self.name!r} async={self.is_async} params={params}>"
+        return self._repr
+
     def _run_sync(self, **kwargs):
         """Run a sync tool with defaults merged before call-time arguments."""
-        return self.function(**{**self.default_params, **kwargs})
+        # dict(defaults, **kwargs) merges in one C call; {**a, **b} builds
+        # and merges through an intermediate.
+        return self.function(**dict(self.default_params, **kwargs))
 
     async def _run_async(self, **kwargs):
         """Run an async tool with defaults merged before call-time arguments."""
-        return await self.function(**{**self.default_params, **kwargs})
+        return await self.function(**dict(self.default_params, **kwargs))
 
 
 class ToolCall:
     """Parsed model request to call a named tool with JSON-like arguments."""
 
+    __slots__ = ("name", "args", "_repr")
+
     def __init__(self, name: str, args: dict):
         self.name = name
         self.args = args
+        self._repr: Optional[str] = None
 
     def get_arg(self, key: str):
         return self.args.get(key)
@@ -142,8 +250,32 @@ class ToolCall:
         return self.args.keys()
 
     def __repr__(self):
-        short = {k: v for k, v in self.args.items() if len(str(v)) < 50}
-        return f"<ToolCall name={self.name!r} args={short}>"
+        # History replay and logging repr the same call repeatedly; the
+        # arg-filtering pass is worth doing once. args are never reassigned
+        # after parsing.
+        if self._repr is None:
+            short = {k: v for k, v in self.args.items() if len(str(v)) < 50}
+            self._repr = f"<ToolCall name={self.name!r} args={short}>"
+        return self._repr
+
+
+_ANNO_MAP = {int: "integer", float: "number", bool: "boolean", str: "string"}
+
+
+@functools.lru_cache(maxsize=None)
+def _param_specs(func: Callable[..., Any]) -> tuple:
+    """Walk a function's signature once, shared across re-decorations.
+
+    Returns (name, json_type, required) triples; descriptions are applied by
+    the caller so differently-documented decorations still share the walk.
+    """
+    specs = []
+    for pname, param in inspect.signature(func).parameters.items():
+        if pname in ("self", "cls"):
+            continue
+        specs.append((pname, _ANNO_MAP.get(param.annotation, "string"),
+                      param.default is inspect.Parameter.empty))
+    return tuple(specs)
 
 
 def autotool(
@@ -157,22 +289,11 @@ def autotool(
     param_descriptions = param_descriptions or {}
 
     def decorator(func: Callable[..., Any]) -> Tool:
-        sig = inspect.signature(func)
         properties: dict = {}
         required: list = []
-
-        for pname, param in sig.parameters.items():
-            if pname in ("self", "cls"):
-                continue
-            anno = param.annotation
-            ptype = (
-                "number" if anno is float
-                else "integer" if anno is int
-                else "boolean" if anno is bool
-                else "string"
-            )
+        for pname, ptype, is_required in _param_specs(inspect.unwrap(func)):
             properties[pname] = {"type": ptype, "description": param_descriptions.get(pname, "")}
-            if param.default is inspect.Parameter.empty:
+            if is_required:
                 required.append(pname)
 
         parameters = {"type": "object", "properties": properties}
@@ -1,8 +1,37 @@
-from .claude import ClaudeAdapter
-from .gemini import GeminiAdapter
-from .openai_ import OpenAIAdapter
-from .deepseek import DeepSeekAdapter
-from .vertex import VertexAdapter
-from .together import TogetherAdapter
-from .universal_openai import UniversalLLMAdapter
-from .xai import XAIAdapter
+import importlib
+from typing import TYPE_CHECKING
+
+# Importing an adapter pulls in its provider SDK, so resolve them lazily
+# (PEP 562): users who only touch one provider don't pay cold-import time
+# for the other seven SDK trees.
+_ADAPTER_MODULES = {
+    "ClaudeAdapter": ".claude",
+    "GeminiAdapter": ".gemini",
+    "OpenAIAdapter": ".openai_",
+    "DeepSeekAdapter": ".deepseek",
+    "VertexAdapter": ".vertex",
+    "TogetherAdapter": ".together",
+    "UniversalLLMAdapter": ".universal_openai",
+    "XAIAdapter": ".xai",
+}
+
+if TYPE_CHECKING:
+    from .claude import ClaudeAdapter
+    from .deepseek import DeepSeekAdapter
+    from .gemini import GeminiAdapter
+    from .openai_ import OpenAIAdapter
+    from .together import TogetherAdapter
+    from .universal_openai import UniversalLLMAdapter
+    from .vertex import VertexAdapter
+    from .xai import XAIAdapter
+
+__all__ = list(_ADAPTER_MODULES)
+
+
+def __getattr__(name: str):
+    module = _ADAPTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache so later lookups skip this hook
+    return value
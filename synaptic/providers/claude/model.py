@@ -5,6 +5,7 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 import anthropic
 from dotenv import load_dotenv
 
+from ...core import _net
 from ...core.base import BaseModel, History, ResponseChunk, ResponseFormat, ResponseMem, ToolCallArgsDelta
 from ...core.tool import Tool, ToolCall, ToolRegistry, collect_tools, register_callback
 from .helpers import history_messages, safe_json, schema_for
@@ -28,8 +29,8 @@ class ClaudeAdapter(BaseModel):
         max_tokens: int = 1024,
         tool_registry: Optional[ToolRegistry] = None,
     ):
-        self.client = anthropic.Anthropic(api_key=api_key or None)
-        self.async_client = anthropic.AsyncAnthropic(api_key=api_key or None)
+        self.client = anthropic.Anthropic(api_key=api_key or None, http_client=_net.get_client())
+        self.async_client = anthropic.AsyncAnthropic(api_key=api_key or None, http_client=_net.get_async_client())
         self.model = model
         self.bound_tools = list(tools or [])
         self.synaptic_tools = list(tools or [])
@@ -45,9 +46,6 @@ class ClaudeAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
 
-    def _invalidate_tools(self) -> None:
-        self._convert_tools()
-
     def _convert_tools(self) -> None:
         all_tools = collect_tools(self.bound_tools, self.tool_registry)
 
@@ -105,7 +103,7 @@ class ClaudeAdapter(BaseModel):
 
         response = self.client.messages.create(**params)
 
-        created = datetime.now().astimezone(timezone.utc)
+        created = datetime.now(timezone.utc)
         message = ""
         tool_calls: List[ToolCall] = []
 
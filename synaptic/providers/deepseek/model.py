@@ -11,6 +11,7 @@ from openai.types.chat import (
     ChatCompletionUserMessageParam,
 )
 
+from ...core import _net
 from ...core.base import BaseModel, History, ResponseChunk, ResponseFormat, ResponseMem, ToolCallArgsDelta
 from ...core.tool import Tool, ToolCall, ToolRegistry, collect_tools, register_callback
 
@@ -33,8 +34,8 @@ class DeepSeekAdapter(BaseModel):
         instructions: str = "",
         tool_registry: Optional[ToolRegistry] = None,
     ):
-        self.client = OpenAI(api_key=api_key, base_url=_BASE_URL)
-        self.async_client = AsyncOpenAI(api_key=api_key, base_url=_BASE_URL)
+        self.client = OpenAI(api_key=api_key, base_url=_BASE_URL, http_client=_net.get_client())
+        self.async_client = AsyncOpenAI(api_key=api_key, base_url=_BASE_URL, http_client=_net.get_async_client())
         self.model = model
         self.bound_tools = list(tools or [])
         self.synaptic_tools = list(tools or [])
@@ -50,9 +51,6 @@ class DeepSeekAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
 
-    def _invalidate_tools(self):
-        self._convert_tools()
-
     def _convert_tools(self) -> None:
         self.openai_tools = []
         if self.response_format != ResponseFormat.NONE:
@@ -115,7 +113,7 @@ class DeepSeekAdapter(BaseModel):
             params["response_format"] = {"type": "json_object"}
 
         response = self.client.chat.completions.create(**params)
-        created = datetime.now().astimezone(timezone.utc)
+        created = datetime.now(timezone.utc)
         choice = response.choices[0]
         message = choice.message.content if choice.message and choice.message.content else ""
         tool_calls: List[ToolCall] = []
@@ -61,31 +61,43 @@ def build_audio_parts(audio: Optional[List[str]]) -> List[types.Part]:
 
 
 def history_contents(history, role_map) -> list[types.Content]:
-    contents = []
     if history is None:
-        return contents
-    for memory in history.effective_mems():
+        return []
+    return mem_contents(history.effective_mems(), role_map)
+
+
+def mem_contents(mems, role_map) -> list[types.Content]:
+    # model_construct skips pydantic validation; every value here comes from
+    # our own memory objects, already validated at the boundary, so paying
+    # field validation again per history entry per request is pure overhead.
+    _part = types.Part.model_construct
+    _content = types.Content.model_construct
+    contents: list[types.Content] = []
+    role_get = role_map.get  # hoisted: one bound-method lookup, not one per memory
+    for memory in mems:
         if isinstance(memory, ResponseMem) and memory.tool_calls:
             parts: list[types.Part] = []
             if memory.message:
-                parts.append(types.Part(text=memory.message))
+                parts.append(_part(text=memory.message))
             for call in memory.tool_calls:
-                parts.append(types.Part(
-                    function_call=types.FunctionCall(name=call.name, args=call.args)
+                parts.append(_part(
+                    function_call=types.FunctionCall.model_construct(name=call.name, args=call.args)
                 ))
-            contents.append(types.Content(role="model", parts=parts))
+            contents.append(_content(role="model", parts=parts))
             results = getattr(memory, "tool_results", None) or []
             response_parts: list[types.Part] = []
             for call, result in zip(memory.tool_calls, results):
                 resp = result.get("result", result.get("error", "")) if isinstance(result, dict) else str(result)
-                response_parts.append(types.Part(
-                    function_response=types.FunctionResponse(name=call.name, response={"result": resp})
+                response_parts.append(_part(
+                    function_response=types.FunctionResponse.model_construct(
+                        name=call.name, response={"result": resp}
+                    )
                 ))
             if response_parts:
-                contents.append(types.Content(role="user", parts=response_parts))
+                contents.append(_content(role="user", parts=response_parts))
         else:
-            contents.append(types.Content(
-                role=role_map.get(memory.role, "user"),
-                parts=[types.Part(text=memory.message)],
+            contents.append(_content(
+                role=role_get(memory.role, "user"),
+                parts=[_part(text=memory.message)],
             ))
     return contents
@@ -1,5 +1,7 @@
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, List, Optional
+from typing import Any, AsyncIterator, List, Optional, Sequence
 
 import google.genai as genai
 from dotenv import load_dotenv
@@ -7,12 +9,47 @@ from google.genai import types
 
 from ...core.base import BaseModel, History, ResponseChunk, ResponseFormat, ResponseMem
 from ...core.tool import Tool, ToolCall, ToolRegistry, collect_tools, register_callback
-from .helpers import build_audio_parts, build_image_parts, history_contents
+from .helpers import build_audio_parts, build_image_parts, history_contents, mem_contents
 
 load_dotenv()
 
+# One genai.Client per API key. The client owns the HTTP connection pool, so
+# sharing it across adapter instances avoids fresh TLS handshakes and socket
+# setup every time a short-lived Model is constructed.
+_client_cache: dict = {}
+_client_lock = threading.Lock()
+
+# Converted types.Tool wrappers keyed by declaration digest.
+_gemini_tool_cache: dict = {}
+
+# Shared empty result so no-history calls don't allocate a fresh list.
+_EMPTY_CONTENTS: tuple = ()
+
+# Terminal batch-job states; anything else means the job is still running.
+_BATCH_DONE = frozenset(
+    {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+)
+
+
+def _get_client(api_key: str) -> genai.Client:
+    client = _client_cache.get(api_key)
+    if client is None:
+        with _client_lock:
+            client = _client_cache.get(api_key)
+            if client is None:
+                client = _client_cache[api_key] = genai.Client(api_key=api_key)
+    return client
+
 
 class GeminiAdapter(BaseModel):
+    # Fixed synaptic-role → Gemini-role translation; class-level so each
+    # adapter doesn't allocate its own copy.
+    role_map = {
+        "user": "user",
+        "assistant": "model",
+        "system": "user",
+    }
+
     def __init__(
         self,
         model: str,
@@ -25,7 +62,7 @@ class GeminiAdapter(BaseModel):
         instructions: str = "",
         tool_registry: Optional[ToolRegistry] = None,
     ):
-        self.client = genai.Client(api_key=api_key)
+        self.client = _get_client(api_key)
         self.model = model
         self.bound_tools = list(tools or [])
         self.synaptic_tools = list(tools or [])
@@ -38,76 +75,119 @@ class GeminiAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
         self.instructions = instructions
-        self.role_map = {
-            "user": "user",
-            "assistant": "model",
-            "system": "user",
-        }
-
-    def _invalidate_tools(self):
-        self._convert_tools()
+        self._contents_cache: list[types.Content] = []
+        self._contents_len = 0
+        self._contents_rev = -1
+        self._contents_history: Optional[History] = None
+        self._instructions_content: Optional[types.Content] = None
+        self._instructions_text: Optional[str] = None
 
     def _convert_tools(self) -> None:
-        self.gemini_tools = []
+        self._config_cache = None  # config embeds the tool list
         all_tools = collect_tools(self.bound_tools, self.tool_registry)
+        gemini_tools: List[types.Tool] = []
         for t in all_tools.values():
-            self.gemini_tools.append(types.Tool(function_declarations=[t.declaration]))  # type: ignore
+            # types.Tool construction pydantic-validates the declaration,
+            # which never changes after Tool.__init__ — build it once per
+            # declaration and share across adapters and registry changes.
+            cached = _gemini_tool_cache.get(t.declaration_hash)
+            if cached is None:
+                cached = _gemini_tool_cache[t.declaration_hash] = types.Tool(
+                    function_declarations=[t.declaration]  # type: ignore
+                )
+            gemini_tools.append(cached)
+        self.gemini_tools = gemini_tools
         self.synaptic_tools = list(all_tools.values())
 
-    def to_contents(self) -> list[types.Content]:
-        return history_contents(self.history, self.role_map)
+    def _request_config(self) -> types.GenerateContentConfig:
+        """The request config, built once and reused until the tool set changes.
 
-    def invoke(
-        self,
-        prompt: Optional[str],
-        role: str = "user",
-        images: Optional[List[str]] = None,
-        audio: Optional[List[str]] = None,
-        **kwargs,
-    ) -> ResponseMem:
-        config = types.GenerateContentConfig(temperature=self.temperature, tools=self.gemini_tools)
-        role = self.role_map.get(role, "user")
-        contents = []
-
-        if self.response_format == ResponseFormat.NONE:
-            config.response_mime_type = "text/plain"
-        elif self.response_format == ResponseFormat.JSON:
-            config.response_mime_type = "application/json"
-            if self.response_schema is not None:
-                config.response_schema = self.response_schema
-            # Models will not call functions when expected to output structured formats
-            config.tools = None
-
-        # 1. System instructions FIRST
-        if self.instructions:
-            contents.append(
-                types.Content(
-                    role=self.role_map.get("system", "user"),
-                    parts=[types.Part(text=self.instructions)],
-                )
-            )
+        Temperature, response format, and schema are fixed at construction,
+        so tool invalidation is the only thing that can stale this.
+        """
+        config = self._config_cache
+        if config is None:
+            config = types.GenerateContentConfig(temperature=self.temperature, tools=self.gemini_tools)
+            if self.response_format == ResponseFormat.NONE:
+                config.response_mime_type = "text/plain"
+            elif self.response_format == ResponseFormat.JSON:
+                config.response_mime_type = "application/json"
+                if self.response_schema is not None:
+                    config.response_schema = self.response_schema
+                # Models will not call functions when expected to output structured formats
+                config.tools = None
+            self._config_cache = config
+        return config
 
-        # 2. Memory + history
-        contents.extend(self.to_contents())
+    def to_contents(self) -> Sequence[types.Content]:
+        """Convert history to Gemini contents, reconverting only the tail delta.
 
-        # 3. Current prompt LAST (text + optional images)
-        prompt_parts: list[types.Part] = []
+        Entries are treated as immutable once converted; the cache resets if
+        the History object changes, shrinks, or drops entries from the front
+        (tracked via its structure revision). Callers must not mutate the
+        returned list. Dedup mode prunes earlier entries, so it always takes
+        the full rebuild path.
+        """
+        history = self.history
+        if history is None or not history.MemoryList:
+            return _EMPTY_CONTENTS
+        if history.dedup_tools:
+            return history_contents(history, self.role_map)
 
+        mems = history.MemoryList
+        if (
+            history is not self._contents_history
+            or history._structure_rev != self._contents_rev
+            or len(mems) < self._contents_len
+        ):
+            self._contents_cache = []
+            self._contents_len = 0
+            self._contents_history = history
+            self._contents_rev = history._structure_rev
+        if len(mems) > self._contents_len:
+            tail = list(mems)[self._contents_len:]
+            self._contents_cache.extend(mem_contents(tail, self.role_map))
+            self._contents_len = len(mems)
+        return self._contents_cache
+
+    def _build_contents(
+        self,
+        prompt: Optional[str],
+        role: str,
+        images: Optional[List[str]],
+        audio: Optional[List[str]],
+    ) -> list[types.Content]:
+        # Current prompt (text + optional images/audio)
+        prompt_parts: list[types.Part] = []
         if prompt and prompt.strip():
             prompt_parts.append(types.Part(text=prompt))
-
         prompt_parts.extend(build_image_parts(images))
         prompt_parts.extend(build_audio_parts(audio))
 
-        if prompt_parts:
-            contents.append(types.Content(role=self.role_map.get(role, "user"), parts=prompt_parts))
-
-        response = self.client.models.generate_content(
-            model=self.model, contents=contents, config=config, **kwargs
+        # Assemble instructions + history + prompt in one allocation instead
+        # of growing a list through append/extend. The instructions Content
+        # only changes when the instructions string does, so rebuild it then
+        # rather than once per call.
+        head: tuple = ()
+        if self.instructions:
+            if self.instructions != self._instructions_text:
+                self._instructions_content = types.Content(
+                    role=self.role_map.get("system", "user"),
+                    parts=[types.Part(text=self.instructions)],
+                )
+                self._instructions_text = self.instructions
+            head = (self._instructions_content,)
+        tail = (
+            (types.Content(role=self.role_map.get(role, "user"), parts=prompt_parts),)
+            if prompt_parts else ()
         )
+        return [*head, *self.to_contents(), *tail]
 
-        created = datetime.now().astimezone(timezone.utc)
-        message = ""
+    def _parse_response(self, response) -> ResponseMem:
+        created = datetime.now(timezone.utc)
+        # += on str recopies the accumulated prefix per part; collect and
+        # join once so multi-part responses parse in linear time.
+        text_parts: List[str] = []
         tool_calls: List[ToolCall] = []
 
         if response.candidates:
@@ -116,7 +196,7 @@ class GeminiAdapter(BaseModel):
             if candidate.content and candidate.content.parts:
                 for part in candidate.content.parts:
                     if part.text:
-                        message += part.text
+                        text_parts.append(part.text)
                     if part.function_call:
                         tool_calls.append(
                             ToolCall(
@@ -127,43 +207,87 @@ class GeminiAdapter(BaseModel):
 
         um = getattr(response, "usage_metadata", None)
         return ResponseMem(
-            message=message, created=created, tool_calls=tool_calls,
+            message="".join(text_parts), created=created, tool_calls=tool_calls,
             input_tokens=getattr(um, "prompt_token_count", 0) or 0,
             output_tokens=getattr(um, "candidates_token_count", 0) or 0,
         )
 
-    async def astream(
-        self, prompt: Optional[str], role: str = "user", images: Optional[List[str]] = None,
-        audio: Optional[List[str]] = None, abort=None, **kwargs
-    ) -> AsyncIterator[ResponseChunk]:
-        role = self.role_map.get(role, "user")
+    def invoke(
+        self,
+        prompt: Optional[str],
+        role: str = "user",
+        images: Optional[List[str]] = None,
+        audio: Optional[List[str]] = None,
+        **kwargs,
+    ) -> ResponseMem:
+        contents = self._build_contents(prompt, role, images, audio)
+        response = self.client.models.generate_content(
+            model=self.model, contents=contents, config=self._request_config(), **kwargs
+        )
+        return self._parse_response(response)
 
-        prompt_parts: list[types.Part] = []
-        if prompt and prompt.strip():
-            prompt_parts.append(types.Part(text=prompt))
-        prompt_parts.extend(build_image_parts(images))
-        prompt_parts.extend(build_audio_parts(audio))
+    async def ainvoke(
+        self,
+        prompt: Optional[str],
+        role: str = "user",
+        images: Optional[List[str]] = None,
+        audio: Optional[List[str]] = None,
+        **kwargs,
+    ) -> ResponseMem:
+        """Async `invoke`; concurrent calls overlap their network latency."""
+        contents = self._build_contents(prompt, role, images, audio)
+        response = await self.client.aio.models.generate_content(
+            model=self.model, contents=contents, config=self._request_config(), **kwargs
+        )
+        return self._parse_response(response)
 
-        contents = self.to_contents()
-        if prompt_parts:
-            contents.append(types.Content(role=role, parts=prompt_parts))
+    def invoke_batch(
+        self,
+        prompts: List[str],
+        role: str = "user",
+        poll_interval: float = 10.0,
+        timeout: Optional[float] = None,
+    ) -> List[ResponseMem]:
+        """Run prompts through Gemini's inline batch endpoint and wait.
 
-        config = types.GenerateContentConfig(temperature=self.temperature, tools=self.gemini_tools)
-        if self.response_format == ResponseFormat.NONE:
-            config.response_mime_type = "text/plain"
-        elif self.response_format == ResponseFormat.JSON:
-            config.response_mime_type = "application/json"
-            if self.response_schema is not None:
-                config.response_schema = self.response_schema
-            config.tools = None
+        Batch-mode requests cost roughly half the per-request unit price, so
+        this suits offline workloads (evals, labeling) where results can wait
+        minutes instead of seconds. Blocks while polling the job with backoff;
+        interactive callers should stay on `invoke`/`ainvoke`. Reach it via
+        `model.llm.invoke_batch(...)` — the endpoint is Gemini-specific, so it
+        lives on the adapter rather than `Model`.
+        """
+        config = self._request_config()
+        requests = [
+            {"contents": self._build_contents(prompt, role, None, None), "config": config}
+            for prompt in prompts
+        ]
+        job = self.client.batches.create(
+            model=self.model, src={"inlined_requests": requests}
+        )
 
-        if self.instructions:
-            contents = [types.Content(
-                role=self.role_map.get("system", "user"),
-                parts=[types.Part(text=self.instructions)],
-            )] + contents
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        delay = poll_interval
+        while getattr(job.state, "name", job.state) not in _BATCH_DONE:
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch job {job.name} still running after {timeout}s")
+            time.sleep(delay)
+            delay = min(delay * 1.5, 60.0)
+            job = self.client.batches.get(name=job.name)
+
+        state = getattr(job.state, "name", job.state)
+        if state != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Batch job {job.name} ended in state {state}")
+        return [self._parse_response(r.response) for r in job.dest.inlined_responses]
+
+    async def astream(
+        self, prompt: Optional[str], role: str = "user", images: Optional[List[str]] = None,
+        audio: Optional[List[str]] = None, abort=None, **kwargs
+    ) -> AsyncIterator[ResponseChunk]:
+        config = self._request_config()
+        contents = self._build_contents(prompt, role, images, audio)
 
-        accumulated_message = ""
+        accumulated: List[str] = []
         tool_calls: List[ToolCall] = []
         usage_metadata = None
 
@@ -172,27 +296,30 @@ class GeminiAdapter(BaseModel):
         ):
             if abort and abort.is_set():
                 return
-            if getattr(response, "usage_metadata", None):
+            # Parts are pydantic models, so text/function_call always exist;
+            # direct attribute loads beat getattr-with-default in this
+            # per-token loop.
+            if response.usage_metadata:
                 usage_metadata = response.usage_metadata
-            candidates = getattr(response, "candidates", None)
+            candidates = response.candidates
             if not candidates:
                 continue
             candidate = candidates[0]
             if not candidate or not candidate.content or not candidate.content.parts:
                 continue
             for part in candidate.content.parts:
-                text = getattr(part, "text", None)
+                text = part.text
                 if text:
-                    accumulated_message += text
+                    accumulated.append(text)
                     yield ResponseChunk(text=text, is_final=False, function_call=None)
-                fc = getattr(part, "function_call", None)
+                fc = part.function_call
                 if fc:
                     tfc = ToolCall(name=fc.name, args=fc.args or {})  # type: ignore[union-attr]
                     tool_calls.append(tfc)
                     yield ResponseChunk(text="", is_final=False, function_call=tfc)
 
         yield ResponseChunk(
-            text=accumulated_message, is_final=True, function_call=None,
+            text="".join(accumulated), is_final=True, function_call=None,
             input_tokens=getattr(usage_metadata, "prompt_token_count", 0) or 0,
             output_tokens=getattr(usage_metadata, "candidates_token_count", 0) or 0,
         )
@@ -1,10 +1,10 @@
 import base64
-import json
 import mimetypes
 import urllib.request
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...core import _json
 from ...core.base import ResponseMem
 from ...core.tool import ToolCall
 
@@ -12,11 +12,11 @@ from ...core.tool import ToolCall
 def result_text(result: Any) -> str:
     try:
         if hasattr(result, "model_dump"):
-            return json.dumps(result.model_dump())
+            return _json.dumps(result.model_dump()).decode()
         if hasattr(result, "__dict__"):
-            return json.dumps(result.__dict__)
+            return _json.dumps(result.__dict__).decode()
         if isinstance(result, (dict, list)):
-            return json.dumps(result)
+            return _json.dumps(result).decode()
     except Exception:
         pass
     return str(result)
@@ -28,9 +28,16 @@ def history_messages(history, instructions: str, role_map: Dict[str, str]) -> Li
         messages.append({"role": "system", "content": instructions})
     if history is None:
         return messages
-    for memory in history.effective_mems():
+    messages.extend(mem_messages(history.effective_mems(), role_map))
+    return messages
+
+
+def mem_messages(mems, role_map: Dict[str, str]) -> List[Dict[str, Any]]:
+    messages: List[Dict[str, Any]] = []
+    role_get = role_map.get
+    for memory in mems:
         msg: Dict[str, Any] = {
-            "role": role_map.get(memory.role, "user"),
+            "role": role_get(memory.role, "user"),
             "content": memory.message,
         }
         if isinstance(memory, ResponseMem) and memory.tool_calls:
@@ -40,7 +47,7 @@ def history_messages(history, instructions: str, role_map: Dict[str, str]) -> Li
                     "type": "function",
                     "function": {
                         "name": call.name,
-                        "arguments": json.dumps(call.args) if call.args else "{}",
+                        "arguments": _json.dumps(call.args).decode() if call.args else "{}",
                     },
                 }
                 for i, call in enumerate(memory.tool_calls)
@@ -91,8 +98,8 @@ def parse_tool_calls(message: Any) -> List[ToolCall]:
         if not hasattr(tool_call, "function"):
             continue
         try:
-            args = json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
-        except json.JSONDecodeError:
+            args = _json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
+        except ValueError:
             args = {}
         calls.append(ToolCall(name=tool_call.function.name, args=args))
     return calls
@@ -103,8 +110,8 @@ def stream_tool_calls(pending: Dict[int, Dict[str, str]]) -> List[ToolCall]:
     for idx in sorted(pending):
         item = pending[idx]
         try:
-            args = json.loads(item["args"]) if item["args"] else {}
-        except json.JSONDecodeError:
+            args = _json.loads(item["args"]) if item["args"] else {}
+        except ValueError:
             args = {}
         calls.append(ToolCall(name=item["name"], args=args))
     return calls
@@ -3,9 +3,10 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 
 from openai import AsyncOpenAI, OpenAI
 
+from ...core import _net
 from ...core.base import BaseModel, History, ResponseChunk, ResponseFormat, ResponseMem, ToolCallArgsDelta
 from ...core.tool import Tool, ToolCall, ToolRegistry, collect_tools, register_callback
-from .helpers import add_prompt, history_messages, parse_tool_calls, stream_tool_calls
+from .helpers import add_prompt, mem_messages, parse_tool_calls, stream_tool_calls
 
 
 class OpenAIAdapter(BaseModel):
@@ -22,8 +23,8 @@ class OpenAIAdapter(BaseModel):
         tool_registry: Optional[ToolRegistry] = None,
         **kwargs,
     ):
-        self.client = OpenAI(api_key=api_key)
-        self.async_client = AsyncOpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=_net.get_client())
+        self.async_client = AsyncOpenAI(api_key=api_key, http_client=_net.get_async_client())
         self.model = model
         self.history = history
         self.bound_tools = list(tools or [])
@@ -32,14 +33,30 @@ class OpenAIAdapter(BaseModel):
         self.temperature = temperature
         self.response_format = response_format
         self.response_schema = response_schema
+        # model_json_schema() walks the whole model tree; format and schema
+        # never change after construction, so build the request param once.
+        if response_format == ResponseFormat.JSON:
+            if hasattr(response_schema, "model_json_schema"):
+                self._response_format_param: Optional[Dict[str, Any]] = {
+                    "type": "json_schema",
+                    "json_schema": {
+                        "name": response_schema.__name__,
+                        "schema": response_schema.model_json_schema(),
+                    },
+                }
+            else:
+                self._response_format_param = {"type": "json_object"}
+        else:
+            self._response_format_param = None
         self.instructions = instructions
         self.tool_registry = tool_registry
         self.role_map = {"user": "user", "assistant": "assistant", "system": "system"}
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
-
-    def _invalidate_tools(self) -> None:
-        self._convert_tools()
+        self._messages_cache: List[Dict[str, Any]] = []
+        self._messages_len = 0
+        self._messages_rev = -1
+        self._messages_history: Optional[History] = None
 
     def _convert_tools(self) -> None:
         self.openai_tools = []
@@ -48,8 +65,44 @@ class OpenAIAdapter(BaseModel):
             self.openai_tools.append({"type": "function", "function": tool.declaration})
         self.synaptic_tools = list(all_tools.values())
 
+    def to_messages(self) -> List[Dict[str, Any]]:
+        """Convert history to chat messages, reconverting only the tail delta.
+
+        Mirrors the Gemini adapter's `to_contents` cache: entries are treated
+        as immutable once converted, and the cache resets if the History
+        object changes, shrinks, or drops entries from the front (tracked via
+        its structure revision). Callers must not mutate the returned list.
+        Dedup mode prunes earlier entries, so it always takes the full
+        rebuild path.
+        """
+        history = self.history
+        if history is None or not history.MemoryList:
+            return []
+        if history.dedup_tools:
+            return mem_messages(history.effective_mems(), self.role_map)
+
+        mems = history.MemoryList
+        if (
+            history is not self._messages_history
+            or history._structure_rev != self._messages_rev
+            or len(mems) < self._messages_len
+        ):
+            self._messages_cache = []
+            self._messages_len = 0
+            self._messages_history = history
+            self._messages_rev = history._structure_rev
+        if len(mems) > self._messages_len:
+            tail = list(mems)[self._messages_len:]
+            self._messages_cache.extend(mem_messages(tail, self.role_map))
+            self._messages_len = len(mems)
+        return self._messages_cache
+
     def _messages(self, prompt: Optional[str], role: str, audio: Optional[List[str]]) -> List[Dict[str, Any]]:
-        messages = history_messages(self.history, self.instructions, self.role_map)
+        # Fresh outer list so add_prompt can't grow the cached one.
+        messages: List[Dict[str, Any]] = []
+        if self.instructions:
+            messages.append({"role": "system", "content": self.instructions})
+        messages.extend(self.to_messages())
         add_prompt(messages, prompt, self.role_map.get(role, "user"), audio)
         return messages
 
@@ -64,32 +117,15 @@ class OpenAIAdapter(BaseModel):
             params["max_tokens"] = params.pop("max_tokens", 1024)
         else:
             params["stream"] = True
-        if self.response_format == ResponseFormat.JSON:
-            if hasattr(self.response_schema, "model_json_schema"):
-                params["response_format"] = {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": self.response_schema.__name__,
-                        "schema": self.response_schema.model_json_schema(),
-                    },
-                }
-            else:
-                params["response_format"] = {"type": "json_object"}
+        if self._response_format_param is not None:
+            params["response_format"] = self._response_format_param
         elif self.openai_tools:
             params["tools"] = self.openai_tools
             params["tool_choice"] = "auto"
         return params
 
-    def invoke(
-        self,
-        prompt: Optional[str],
-        role: str = "user",
-        audio: Optional[List[str]] = None,
-        **kwargs,
-    ) -> ResponseMem:
-        params = self._request(self._messages(prompt, role, audio), False, kwargs)
-        response = self.client.chat.completions.create(**params)
-        created = datetime.now().astimezone(timezone.utc)
+    def _parse_response(self, response) -> ResponseMem:
+        created = datetime.now(timezone.utc)
         message = ""
         tool_calls: List[ToolCall] = []
         if response.choices:
@@ -103,6 +139,27 @@ class OpenAIAdapter(BaseModel):
             output_tokens=getattr(u, "completion_tokens", 0) or 0,
         )
 
+    def invoke(
+        self,
+        prompt: Optional[str],
+        role: str = "user",
+        audio: Optional[List[str]] = None,
+        **kwargs,
+    ) -> ResponseMem:
+        params = self._request(self._messages(prompt, role, audio), False, kwargs)
+        return self._parse_response(self.client.chat.completions.create(**params))
+
+    async def ainvoke(
+        self,
+        prompt: Optional[str],
+        role: str = "user",
+        audio: Optional[List[str]] = None,
+        **kwargs,
+    ) -> ResponseMem:
+        """Async `invoke`; concurrent calls overlap their network latency."""
+        params = self._request(self._messages(prompt, role, audio), False, kwargs)
+        return self._parse_response(await self.async_client.chat.completions.create(**params))
+
     async def astream(
         self,
         prompt: Optional[str],
@@ -113,7 +170,8 @@ class OpenAIAdapter(BaseModel):
     ) -> AsyncIterator[ResponseChunk]:
         params = self._request(self._messages(prompt, role, audio), True, kwargs)
         params["stream_options"] = {"include_usage": True}
-        accumulated = ""
+        # Collect and join once; += on str goes quadratic over a long stream.
+        accumulated: List[str] = []
         pending: Dict[int, Dict[str, str]] = {}
 
         async with self.async_client.chat.completions.stream(**params) as stream:
@@ -124,7 +182,7 @@ class OpenAIAdapter(BaseModel):
                     continue
                 delta = chunk.choices[0].delta
                 if delta.content:
-                    accumulated += delta.content
+                    accumulated.append(delta.content)
                     yield ResponseChunk(text=delta.content)
                 for tc_delta in delta.tool_calls or []:
                     current = pending.setdefault(tc_delta.index, {"name": "", "args": ""})
@@ -138,6 +196,6 @@ class OpenAIAdapter(BaseModel):
 
         for call in stream_tool_calls(pending):
             yield ResponseChunk(text="", function_call=call)
-        yield ResponseChunk(text=accumulated, is_final=True,
+        yield ResponseChunk(text="".join(accumulated), is_final=True,
                             input_tokens=getattr(u, "prompt_tokens", 0) or 0,
                             output_tokens=getattr(u, "completion_tokens", 0) or 0)
@@ -42,9 +42,6 @@ class TogetherAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
 
-    def _invalidate_tools(self) -> None:
-        self._convert_tools()
-
     def _convert_tools(self) -> None:
         self.together_tools = []
         all_tools = collect_tools(self.bound_tools, self.tool_registry)
@@ -77,7 +74,7 @@ class TogetherAdapter(BaseModel):
         **kwargs,
     ) -> ResponseMem:
         response = self.client.chat.completions.create(**self._request(prompt, role, images, audio, False, kwargs))
-        created = datetime.now().astimezone(timezone.utc)
+        created = datetime.now(timezone.utc)
         message = ""
         tool_calls: List[ToolCall] = []
         if response.choices:
@@ -8,6 +8,7 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 
 from openai import AsyncOpenAI, OpenAI
 
+from ...core import _net
 from ...core.base import BaseModel, History, ResponseChunk, ResponseFormat, ResponseMem, ToolCallArgsDelta
 from ...core.tool import Tool, ToolCall, ToolRegistry, collect_tools, register_callback
 
@@ -26,8 +27,8 @@ class UniversalLLMAdapter(BaseModel):
         instructions: str = "",
         tool_registry: Optional[ToolRegistry] = None,
     ):
-        self.client = OpenAI(api_key=api_key or "none", base_url=base_url)
-        self.async_client = AsyncOpenAI(api_key=api_key or "none", base_url=base_url)
+        self.client = OpenAI(api_key=api_key or "none", base_url=base_url, http_client=_net.get_client())
+        self.async_client = AsyncOpenAI(api_key=api_key or "none", base_url=base_url, http_client=_net.get_async_client())
         self.model = model
         self.history = history
         self.bound_tools = list(tools or [])
@@ -43,9 +44,6 @@ class UniversalLLMAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
 
-    def _invalidate_tools(self):
-        self._convert_tools()
-
     def _convert_tools(self) -> None:
         self.openai_tools = []
         all_tools = collect_tools(self.bound_tools, self.tool_registry)
@@ -121,7 +119,7 @@ class UniversalLLMAdapter(BaseModel):
             request_params["response_format"] = {"type": "json_object"}
 
         response = self.client.chat.completions.create(**request_params)
-        created = datetime.now().astimezone(timezone.utc)
+        created = datetime.now(timezone.utc)
         message = ""
         tool_calls: List[ToolCall] = []
         if response.choices:
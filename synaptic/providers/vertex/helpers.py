@@ -11,12 +11,24 @@ from ...core.tool import ToolCall
 
 
 def history_contents(history, role_map) -> List[Content]:
-    contents = []
     if history is None:
-        return contents
-    for mem in history.effective_mems():
+        return []
+    return mem_contents(history.effective_mems(), role_map)
+
+
+def mem_contents(mems, role_map) -> List[Content]:
+    contents: List[Content] = []
+    for mem in mems:
         if isinstance(mem, ResponseMem) and mem.tool_calls:
-            contents.append(Content(role="model", parts=[Part.from_text(mem.message or "")]))
+            # Replay the calls as typed function_call parts, mirroring what
+            # the model actually emitted; a stringified fallback would cost
+            # extra tokens and make the model re-parse its own calls.
+            parts = [Part.from_text(mem.message)] if mem.message else []
+            parts.extend(
+                Part.from_dict({"function_call": {"name": call.name, "args": call.args}})
+                for call in mem.tool_calls
+            )
+            contents.append(Content(role="model", parts=parts))
             response_parts = []
             for call, result in zip(mem.tool_calls, mem.tool_results or []):
                 resp = result.get("result", result.get("error", "")) if isinstance(result, dict) else str(result)
@@ -55,7 +67,7 @@ def generation_config(response_format: ResponseFormat, temperature: float) -> Ge
 
 
 def response_mem(response) -> ResponseMem:
-    created = datetime.now().astimezone(timezone.utc)
+    created = datetime.now(timezone.utc)
     message = ""
     calls: List[ToolCall] = []
     if response.candidates:
@@ -63,9 +75,9 @@ def response_mem(response) -> ResponseMem:
         for fc in cand.function_calls or []:
             calls.append(ToolCall(name=fc.name, args=dict(fc.args) or {}))
         if cand.content and cand.content.parts:
-            for part in cand.content.parts:
-                if part.text:
-                    message += part.text
+            # Single join instead of += per part, which recopies the
+            # accumulated prefix and goes quadratic on many-part responses.
+            message = "".join(part.text for part in cand.content.parts if part.text)
     um = getattr(response, "usage_metadata", None)
     return ResponseMem(
         message=message, created=created, tool_calls=calls,
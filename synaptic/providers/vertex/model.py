@@ -15,10 +15,37 @@ from vertexai.generative_models import (
 from ...core.base import BaseModel, History, ResponseChunk, ResponseFormat, ResponseMem
 from ...core.tool import ToolCall, ToolRegistry, collect_tools, register_callback
 from ...core.tool import Tool as ST
-from .helpers import audio_parts, generation_config, history_contents, response_mem
+from .helpers import audio_parts, generation_config, history_contents, mem_contents, response_mem
 
 load_dotenv()
 
+# Converted FunctionDeclaration objects keyed by declaration digest.
+# Declarations never change after Tool.__init__, so the SDK-side parse and
+# proto construction happen once per schema instead of per invalidation.
+_vertex_decl_cache: dict = {}
+
+# vertex_init resolves credentials and sets SDK-global state, and
+# GenerativeModel carries client setup — both measurably slow. Initialize
+# once per (project, location) and share model handles across adapters so
+# short-lived Models don't repay auth and client construction.
+_init_cache: set = set()
+_model_cache: dict = {}
+_init_lock = threading.Lock()
+
+
+def _get_model(project: str, location: str, model: str) -> GenerativeModel:
+    init_key = (project, location)
+    if init_key not in _init_cache:
+        with _init_lock:
+            if init_key not in _init_cache:
+                vertex_init(project=project, location=location)
+                _init_cache.add(init_key)
+    key = (project, location, model)
+    handle = _model_cache.get(key)
+    if handle is None:
+        handle = _model_cache[key] = GenerativeModel(model)
+    return handle
+
 
 class VertexAdapter(BaseModel):
     def __init__(
@@ -35,10 +62,8 @@ class VertexAdapter(BaseModel):
         instructions: str = "",
         tool_registry: Optional[ToolRegistry] = None,
     ):
-        vertex_init(project=project, location=location)
-
         self.model_name = model
-        self.model = GenerativeModel(model)
+        self.model = _get_model(project, location, model)
         self.temperature = temperature
         self.history = history
         self.bound_tools = list(tools or [])
@@ -58,8 +83,15 @@ class VertexAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
 
-    def _invalidate_tools(self):
-        self._convert_tools()
+        self._contents_cache: List[Content] = []
+        self._contents_len = 0
+        self._contents_rev = -1
+        self._contents_history: Optional[History] = None
+        # Temperature and response format are fixed at construction, so the
+        # config never changes; build it once instead of per call.
+        self._generation_config = generation_config(response_format, temperature)
+        self._instructions_content: Optional[Content] = None
+        self._instructions_text: Optional[str] = None
 
     def _convert_tools(self):
         """Convert TOOL_REGISTRY + explicit tools → Vertex Tool definitions."""
@@ -70,40 +102,94 @@ class VertexAdapter(BaseModel):
             decl = tool.declaration
 
             if isinstance(decl, dict):
-                decl = FunctionDeclaration(
-                    name=decl.get("name"),  # type: ignore
-                    description=decl.get("description"),  # type: ignore
-                    parameters=decl.get("parameters"),  # type: ignore
-                )
+                cached = _vertex_decl_cache.get(tool.declaration_hash)
+                if cached is None:
+                    cached = _vertex_decl_cache[tool.declaration_hash] = FunctionDeclaration(
+                        name=decl.get("name"),  # type: ignore
+                        description=decl.get("description"),  # type: ignore
+                        parameters=decl.get("parameters"),  # type: ignore
+                    )
+                decl = cached
 
             all_declarations.append(decl)
 
         if all_declarations:
-            self.vertex_tools = [Tool(function_declarations=all_declarations)]
+            # The wrapper is passed by reference into every generate_content;
+            # reusing it for an unchanged declaration set lets the SDK keep
+            # its serialized form instead of rebuilding per invalidation.
+            sig = tuple(map(id, all_declarations))
+            if sig != getattr(self, "_decl_sig", None):
+                self._decl_tool = Tool(function_declarations=all_declarations)
+                self._decl_sig = sig
+            self.vertex_tools = [self._decl_tool]
         else:
             self.vertex_tools = []
 
         self.synaptic_tools = list(all_tools.values())
 
     def to_contents(self) -> List[Content]:
-        return history_contents(self.history, self.role_map)
+        """Convert history to Vertex contents, reconverting only the tail delta.
+
+        Entries are treated as immutable once converted; the cache resets if
+        the History object changes, shrinks, or drops entries from the front
+        (tracked via its structure revision). Callers must not mutate the
+        returned list. Dedup mode prunes earlier entries, so it always takes
+        the full rebuild path.
+        """
+        history = self.history
+        if history is None or not history.MemoryList:
+            return []
+        if history.dedup_tools:
+            return history_contents(history, self.role_map)
+
+        mems = history.MemoryList
+        if (
+            history is not self._contents_history
+            or history._structure_rev != self._contents_rev
+            or len(mems) < self._contents_len
+        ):
+            self._contents_cache = []
+            self._contents_len = 0
+            self._contents_history = history
+            self._contents_rev = history._structure_rev
+        if len(mems) > self._contents_len:
+            tail = list(mems)[self._contents_len:]
+            self._contents_cache.extend(mem_contents(tail, self.role_map))
+            self._contents_len = len(mems)
+        return self._contents_cache
 
     def _messages(self, prompt: Optional[str], role: str, audio: Optional[List[str]]) -> List[Content]:
-        role = self.role_map.get(role, "user")
-        messages: List[Content] = self.to_contents()
+        # Fresh outer list so the prompt append can't grow the cached one.
+        messages: List[Content] = []
+        if self.instructions:
+            # Rebuild the instructions Content only when the string changes.
+            if self.instructions != self._instructions_text:
+                self._instructions_content = Content(
+                    role="user", parts=[Part.from_text(self.instructions)]
+                )
+                self._instructions_text = self.instructions
+            messages.append(self._instructions_content)
+        messages.extend(self.to_contents())
         if prompt is not None or audio:
             parts = [Part.from_text(prompt or "")] + audio_parts(audio)
-            messages.append(Content(role=role, parts=parts))
-        if self.instructions:
-            system_msg = Content(role="user", parts=[Part.from_text(self.instructions)])
-            messages = [system_msg] + messages
+            messages.append(Content(role=self.role_map.get(role, "user"), parts=parts))
         return messages
 
     def invoke(self, prompt: Optional[str], role: str = "user", audio: Optional[List[str]] = None, **kwargs) -> ResponseMem:
         messages = self._messages(prompt, role, audio)
         response = self.model.generate_content(
             messages,
-            generation_config=generation_config(self.response_format, self.temperature),
+            generation_config=self._generation_config,
+            tools=self.vertex_tools,
+        )
+        return response_mem(response)
+
+    async def ainvoke(self, prompt: Optional[str], role: str = "user", audio: Optional[List[str]] = None, **kwargs) -> ResponseMem:
+        """Async `invoke`; concurrent calls overlap their network latency."""
+        messages = self._messages(prompt, role, audio)
+        response = await self.model.generate_content_async(
+            messages,
+            generation_config=self._generation_config,
             tools=self.vertex_tools,
         )
         return response_mem(response)
@@ -119,7 +205,7 @@ class VertexAdapter(BaseModel):
         pushes responses into an asyncio.Queue.
         """
         messages = self._messages(prompt, role, audio)
-        config = generation_config(self.response_format, self.temperature)
+        config = self._generation_config
         loop = asyncio.get_running_loop()
         q: asyncio.Queue[Optional[Any]] = asyncio.Queue()
 
@@ -140,7 +226,8 @@ class VertexAdapter(BaseModel):
 
         threading.Thread(target=producer, daemon=True).start()
 
-        accumulated_message = ""
+        # Collect and join once; += on str goes quadratic over a long stream.
+        accumulated: List[str] = []
         tool_calls: List[ToolCall] = []
         usage_metadata = None
 
@@ -170,11 +257,11 @@ class VertexAdapter(BaseModel):
             if cand.content and cand.content.parts:
                 for part in cand.content.parts:
                     if part.text:
-                        accumulated_message += part.text
+                        accumulated.append(part.text)
                         yield ResponseChunk(text=part.text, is_final=False, function_call=None)
 
         yield ResponseChunk(
-            text=accumulated_message, is_final=True, function_call=None,
+            text="".join(accumulated), is_final=True, function_call=None,
             input_tokens=getattr(usage_metadata, "prompt_token_count", 0) or 0,
             output_tokens=getattr(usage_metadata, "candidates_token_count", 0) or 0,
         )
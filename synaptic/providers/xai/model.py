@@ -68,9 +68,6 @@ class XAIAdapter(BaseModel):
         register_callback(self._invalidate_tools, tool_registry)
         self._invalidate_tools()
 
-    def _invalidate_tools(self) -> None:
-        self._convert_tools()
-
     def _convert_tools(self) -> None:
         all_tools = collect_tools(self.bound_tools, self.tool_registry)
         self.xai_tools = [_make_xai_tool(t) for t in all_tools.values()]
@@ -148,7 +145,7 @@ class XAIAdapter(BaseModel):
         return client.chat.create(**kwargs)
 
     def _parse_response(self, response: Any, usage: Any = None) -> ResponseMem:
-        created = datetime.now().astimezone(timezone.utc)
+        created = datetime.now(timezone.utc)
         message = response.content or ""
         tool_calls = parse_calls(response)
         if self.response_format == ResponseFormat.JSON and not tool_calls: